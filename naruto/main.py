@@ -1,112 +1,77 @@
-import plotnine as pn
 import polars as pl
 
 seasons_count_df: pl.DataFrame = pl.DataFrame(
-    data=[
-        (1, 32),
-        (2, 21),
-        (3, 18),
-        (4, 17),
-        (5, 24),
-        (6, 31),
-        (7, 8),
-        (8, 24),
-        (9, 21),
-        (10, 25),
-        (11, 21),
-        (12, 33),
-        (13, 20),
-        (14, 25),
-        (15, 28),
-        (16, 13),
-        (17, 11),
-        (18, 21),
-        (19, 20),
-        (20, 45),
-        (21, 21),
-        (22, 21),
-    ],
+    data={
+        "SeasonID": list(range(1, 23)),
+        "EpisodeCount": [
+            32, 21, 18, 17, 24, 31, 8, 24, 21, 25, 21,
+            33, 20, 25, 28, 13, 11, 21, 20, 45, 21, 21,
+        ],
+    },
     schema={
         "SeasonID": pl.UInt8,
         "EpisodeCount": pl.UInt32,
     },
-    orient="row",
-)
+)  # fmt: skip
 
 apple_df: pl.DataFrame = pl.DataFrame(
-    data=[
-        (1, True),
-        (2, True),
-        (3, False),
-        (4, False),
-        (5, False),
-        (6, True),
-        (7, True),
-        (8, True),
-        (9, False),
-        (10, True),
-        (11, True),
-        (12, True),
-        (13, False),
-        (14, True),
-        (15, True),
-        (16, True),
-        (17, True),
-        (18, True),
-        (19, False),
-        (20, True),
-        (21, True),
-        (22, False),
-    ],
+    data={
+        "SeasonID": list(range(1, 23)),
+        "AppleTV": [
+            True, True, False, False, False, True, True, True, False, True, True,
+            True, False, True, True, True, True, True, False, True, True, False,
+        ],
+    },
     schema={
         "SeasonID": pl.UInt8,
         "AppleTV": pl.Boolean,
     },
-    orient="row",
-)
+)  # fmt: skip
 
 
 # https://naruto-official.com/en/anime/naruto2
+arc_official_schema: dict[str, pl.DataType] = {
+    "EpisodeStart": pl.UInt32,
+    "EpisodeEnd": pl.UInt32,
+    "ArcName": pl.Utf8,
+    "AnimeOriginal": pl.Boolean,
+}
+# one row per arc, transposed into columns below
+arc_official_rows: list[tuple[int, int, str, bool]] = [
+    (221, 252, "Kazekage Rescue", False),
+    (253, 273, "Long-Awaited Reunion", False),
+    (274, 291, "Guardian Shinobi Twelve", True),
+    (292, 308, "Immortal Devastators: Hidan and Kakuzu", False),
+    (309, 332, "Three-Tails' Appearance", True),
+    (333, 363, "Master's Prophecy and Vengence", False),
+    (364, 371, "Six-Tails Unleashed", True),
+    (372, 395, "Two Saviors", False),
+    (396, 416, "Past Arc: The Locus of the Leaf", True),
+    (417, 441, "The Five Kage Assemble", False),
+    (442, 462, "Paradise Life on a Boat", True),
+    (463, 495, "Nine-Tails Taiming and Karmic Encounters", False),
+    (496, 509, "The Seven Ninja Swordmen", False),
+    (510, 515, "Power", True),
+    (516, 540, "The Great Ninja War: ssailants from Afar", False),
+    (541, 568, "The Great Ninja War: Sasuke and Itachi", False),
+    (569, 581, "Kakashi: Shadow of the Anbu Black Ops", True),
+    (582, 592, "The Great Ninja War: Team 7 Returns", False),
+    (593, 613, "The Great Ninja War: Obito Uchiha", False),
+    (614, 633, "In Naruto's Footsteps: The Friends' Path", True),
+    (634, 651, "Infinite Tsukuyomi: The Invocation", False),
+    (652, 670, "Jiraiya Shinobi Handbook: The Tale of Naruto the Hero", True),
+    (671, 678, "Itachi's Story: Daylight / Midnight", True),
+    (679, 689, "The Origins of Ninshu: The Two Souls, Indra and Ashura", True),
+    (690, 699, "Naruto and Sasuke", False),
+    (700, 703, "Nostalgic Days", True),
+    (704, 708, "Sasuke Shinden: Book of Sunrise", True),
+    (709, 713, "Shikamaru Hiden: A Cloud Drifting in Silent Darkness", True),
+    (714, 720, "The Perfect Day for a Wedding", True),
+]
 arc_official_df: pl.DataFrame = (
     pl.DataFrame(
-        data=[
-            (221, 252, "Kazekage Rescue", False),
-            (253, 273, "Long-Awaited Reunion", False),
-            (274, 291, "Guardian Shinobi Twelve", True),
-            (292, 308, "Immortal Devastators: Hidan and Kakuzu", False),
-            (309, 332, "Three-Tails' Appearance", True),
-            (333, 363, "Master's Prophecy and Vengence", False),
-            (364, 371, "Six-Tails Unleashed", True),
-            (372, 395, "Two Saviors", False),
-            (396, 416, "Past Arc: The Locus of the Leaf", True),
-            (417, 441, "The Five Kage Assemble", False),
-            (442, 462, "Paradise Life on a Boat", True),
-            (463, 495, "Nine-Tails Taiming and Karmic Encounters", False),
-            (496, 509, "The Seven Ninja Swordmen", False),
-            (510, 515, "Power", True),
-            (516, 540, "The Great Ninja War: ssailants from Afar", False),
-            (541, 568, "The Great Ninja War: Sasuke and Itachi", False),
-            (569, 581, "Kakashi: Shadow of the Anbu Black Ops", True),
-            (582, 592, "The Great Ninja War: Team 7 Returns", False),
-            (593, 613, "The Great Ninja War: Obito Uchiha", False),
-            (614, 633, "In Naruto's Footsteps: The Friends' Path", True),
-            (634, 651, "Infinite Tsukuyomi: The Invocation", False),
-            (652, 670, "Jiraiya Shinobi Handbook: The Tale of Naruto the Hero", True),
-            (671, 678, "Itachi's Story: Daylight / Midnight", True),
-            (679, 689, "The Origins of Ninshu: The Two Souls, Indra and Ashura", True),
-            (690, 699, "Naruto and Sasuke", False),
-            (700, 703, "Nostalgic Days", True),
-            (704, 708, "Sasuke Shinden: Book of Sunrise", True),
-            (709, 713, "Shikamaru Hiden: A Cloud Drifting in Silent Darkness", True),
-            (714, 720, "The Perfect Day for a Wedding", True),
-        ],
-        schema={
-            "EpisodeStart": pl.UInt32,
-            "EpisodeEnd": pl.UInt32,
-            "ArcName": pl.Utf8,
-            "AnimeOriginal": pl.Boolean,
-        },
-        orient="row",
+        data=dict(zip(arc_official_schema, map(list, zip(*arc_official_rows)))),
+        schema=arc_official_schema,
     )
     # subtract 220 from original Naruto
     .with_columns(
@@ -119,37 +84,61 @@ arc_official_df: pl.DataFrame = (
     )
 )
 
-episodes_df: pl.DataFrame = (
-    seasons_count_df.select(pl.all().repeat_by(by=pl.col("EpisodeCount")).explode())
-    .with_row_index(
-        name="EpisodeID",
-        offset=1,
+# first episode of each season, carrying AppleTV along with it
+season_starts_df: pl.LazyFrame = (
+    seasons_count_df.lazy()
+    .select(
+        "SeasonID",
+        (pl.col("EpisodeCount").cum_sum() - pl.col("EpisodeCount") + 1).alias(
+            "EpisodeStart"
+        ),
     )
-    .select("EpisodeID", "SeasonID")
     .join(
-        other=arc_official_df.select(pl.all().exclude("EpisodeEnd")),
+        other=apple_df.lazy(),
+        on="SeasonID",
+        how="left",
+    )
+)
+
+# both season and arc starts are sorted,
+# so each episode is matched to the last start at or before it
+episodes_df: pl.LazyFrame = (
+    seasons_count_df.lazy()
+    .select(
+        pl.int_range(
+            1,
+            pl.col("EpisodeCount").sum() + 1,
+            dtype=pl.UInt32,
+        ).alias("EpisodeID")
+    )
+    .join_asof(
+        other=season_starts_df,
         left_on="EpisodeID",
         right_on="EpisodeStart",
-        how="left",
+        strategy="backward",
     )
-    .with_columns(
-        pl.col("ArcID").fill_null(strategy="forward"),
-        pl.col("ArcName").fill_null(strategy="forward"),
-        pl.col("AnimeOriginal").fill_null(strategy="forward"),
+    .join_asof(
+        other=arc_official_df.lazy().select(pl.all().exclude("EpisodeEnd")),
+        left_on="EpisodeID",
+        right_on="EpisodeStart",
+        strategy="backward",
     )
     # .with_columns(
     #     (pl.col("ArcID").cast(pl.Utf8).str.zfill(2) + " - " + pl.col("ArcName")).alias(
     #         "ArcName"
     #     ),
     # )
-    .join(
-        other=apple_df,
-        on="SeasonID",
-        how="left",
+    .select(
+        "EpisodeID",
+        "SeasonID",
+        "ArcID",
+        "ArcName",
+        "AnimeOriginal",
+        "AppleTV",
     )
 )
 
-seasons_arcs_df: pl.DataFrame = episodes_df.group_by(
+seasons_arcs_df: pl.LazyFrame = episodes_df.group_by(
     "ArcID",
     maintain_order=True,
 ).agg(
@@ -159,27 +148,32 @@ seasons_arcs_df: pl.DataFrame = episodes_df.group_by(
     pl.first("AnimeOriginal"),
     pl.first("AppleTV"),
 )
-print(seasons_arcs_df.filter(~pl.col("AnimeOriginal")))
-core_seasons = (
-    seasons_arcs_df.filter(
-        ~pl.col("AnimeOriginal"),
-        pl.col("AppleTV"),
-    )
-    .get_column("SeasonID")
-    .unique()
-    .sort()
+
+# collecting together so the shared plan above only runs once
+non_original_arcs_df, core_seasons_df, non_original_not_apple_df = pl.collect_all(
+    [
+        seasons_arcs_df.filter(~pl.col("AnimeOriginal")),
+        # seasons with at least one non-original arc on AppleTV
+        seasons_arcs_df.group_by("SeasonID")
+        .agg((~pl.col("AnimeOriginal") & pl.col("AppleTV")).any().alias("Core"))
+        .filter(pl.col("Core"))
+        .select(pl.col("SeasonID").sort()),
+        seasons_arcs_df.filter(
+            ~pl.col("AnimeOriginal"),
+            ~pl.col("AppleTV"),
+        ),
+    ]
 )
+print(non_original_arcs_df)
+core_seasons: pl.Series = core_seasons_df.get_column("SeasonID")
 print(core_seasons)
-print(
-    seasons_arcs_df.filter(
-        ~pl.col("AnimeOriginal"),
-        ~pl.col("AppleTV"),
-    )
-)
+print(non_original_not_apple_df)
+
+# import plotnine as pn
 
 # episode_plot: pn.ggplot = (
 #     pn.ggplot(
-#         data=episodes_df,
+#         data=episodes_df.collect(),
 #     )
 #     + pn.geom_point(
 #         mapping=pn.aes(
@@ -13,12 +13,12 @@ nick_processed_schema: dict[str, pl.DataType] = {
     "NumberSeasons": pl.UInt16,
 }
 
-nick_df: pl.DataFrame = pl.scan_parquet(source="./data/nick.parquet").collect()
+# kept lazy so filters are pushed down into the parquet scan
+nick_df: pl.LazyFrame = pl.scan_parquet(source="./data/nick.parquet")
 
 # which Nicktoons had the longest run
 animated_length_df: pl.DataFrame = (
-    nick_df.lazy()
-    .filter(pl.col("H4") == 'Animated ("Nicktoons")')
+    nick_df.filter(pl.col("H4") == 'Animated ("Nicktoons")')
     .with_columns(pl.col("FinaleDate").fill_null(Date(2024, 5, 19)))
     .with_columns(
         # active or not
@@ -1,16 +1,36 @@
+import functools
+import logging
+import os
+import time
 from typing import Literal
 import warnings
 
-from bs4 import BeautifulSoup
-from bs4.element import NavigableString
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
 import polars as pl
 import requests as rq
 
+logger: logging.Logger = logging.getLogger(__name__)
+
 nick_url: str = (
     "https://en.wikipedia.org/wiki/List_of_programs_broadcast_by_Nickelodeon"
 )
-wiki_page: rq.Response = rq.get(nick_url)
-wiki_soup: BeautifulSoup = BeautifulSoup(wiki_page.content, "html.parser")
+nick_cache: str = "./data/nick.html"
+# reused for every request, so the connection is kept open if we fetch more pages
+nick_session: rq.Session = rq.Session()
+# everything we want is under this div, so no need to build the rest of the page
+nick_strainer: SoupStrainer = SoupStrainer(
+    name="div",
+    class_="mw-content-ltr mw-parser-output",
+)
+
+
+# position of each header tag in `NickelodeanHeaderDepth._header_vals`
+_header_levels: dict[str, int] = {"h2": 0, "h3": 1, "h4": 2, "h5": 3}
+# H3 after which there is nothing we want, page currently has the typo
+_stop_h3s: frozenset[str] = frozenset(
+    ["Former aquired programming", "Former acquired programming"]
+)
 
 
 class NickelodeanHeaderDepth:
@@ -28,14 +48,22 @@ class NickelodeanHeaderDepth:
     We will keep track of the current level, as well as the values for each.
     When we decrease back to a previous level,
     we have to clear the contents of all the preceeding levels as well.
+
+    Once we reach H3: "Former aquired programming" (or with the typo fixed),
+    or any H2 after "Former programming",
+    there is nothing else we want, so `stop` is set.
     """
 
+    __slots__ = ("_header_index", "_header_vals", "_stop")
+
     _header_index: Literal[0, 1, 2, 3]
     _header_vals: list[str | None]
+    _stop: bool
 
     def __init__(self) -> None:
         self._header_index = 0
         self._header_vals = [None, None, None, None]
+        self._stop = False
 
     @property
     def h2(self) -> str | None:
@@ -57,34 +85,35 @@ class NickelodeanHeaderDepth:
     def depth(self) -> int:
         return self._header_index + 2
 
-    def update_depth(self, ns: NavigableString) -> None:
+    @property
+    def stop(self) -> bool:
+        return self._stop
+
+    def as_tuple(self) -> tuple[str | None, str | None, str | None, str | None]:
         """
-        Inputs NavigableString to update the depth.
+        All four header values at once, in the order H2, H3, H4, H5.
         """
-        new_index: int
-        if ns.name == "h2":
-            new_index = 0
-            self._header_vals[0] = ns.text
-        elif ns.name == "h3":
-            new_index = 1
-            self._header_vals[1] = ns.text
-        elif ns.name == "h4":
-            new_index = 2
-            self._header_vals[2] = ns.text
-        elif ns.name == "h5":
-            new_index = 3
-            self._header_vals[3] = ns.text
-        else:
-            warnings.warn("Input NavigableString is not a header type.")
+        return tuple(self._header_vals)
+
+    def update_depth(self, ns: Tag) -> None:
+        """
+        Inputs header Tag to update the depth.
+        """
+        new_index: int | None = _header_levels.get(ns.name)
+        if new_index is None:
+            warnings.warn("Input Tag is not a header type.")
             return
 
-        # should be either -1 (increase of 1), 0 (same level)
-        # or some positive number that indicates how many times we have to decrease
-        # NOTE: should add warning if its less than -1?
-        index_diff: int = self._header_index - new_index
-        while index_diff > 0:
-            self._header_vals[new_index + index_diff] = None
-            index_diff -= 1
+        # don't want anything after these
+        if new_index == 0 and self._header_vals[0] == "Former programming":
+            self._stop = True
+        elif new_index == 1 and ns.text in _stop_h3s:
+            self._stop = True
+        self._header_vals[new_index] = ns.text
+
+        # clearing every level below the new one,
+        # only does something when we go back up to a previous level
+        self._header_vals[new_index + 1 :] = [None] * (3 - new_index)
         self._header_index = new_index
 
     def __repr__(self) -> str:
@@ -107,199 +136,187 @@ __col_map: dict[str, str] = {
     "Note(s)": "_notes",  # will drop this one
 }
 
+# columns pulled out of each table by `_select_values`
+__raw_cols: list[str] = ["Title", "PremiereDate", "FinaleDate", "NumberSeasons"]
+
 
-def _remove_notes(col_name: str, remove_shorts: bool = False) -> pl.Expr:
+def _remove_notes(expr: pl.Expr, remove_shorts: bool = False) -> pl.Expr:
     """
-    Removes any Wikipedia notes from column name.
-    Just split by "[" and then take first element.
+    Removes any Wikipedia notes from a string expression.
+    Just drop everything from the first "[" on,
+    along with any whitespace in front of it.
 
     Also removes the "shorts" part for dates from
     Former programming > Original programming > live-action > Comedy
-    > The Adventrues of Pete & Pete.
+    > The Adventrues of Pete & Pete,
+    by also dropping everything up to the last ")".
+
+    Both are done with a single regex,
+    rather than splitting into a list column and taking one element.
     """
     if remove_shorts:
-        return (
-            pl.col(col_name)
-            # getting rid of notes
-            .str.split("[")
-            .list[0]
-            # getting rid of shorts part
-            .str.split(")")
-            .list[-1]
-        )
+        return expr.str.extract(r"^(?:[^\[]*\))?([^\[\)]*)", 1)
     else:
-        return (
-            pl.col(col_name)
-            # getting rid of notes
-            .str.split("[")
-            .list[0]
-        )
+        return expr.str.replace(r"(?s)\s*\[.*$", "")
 
 
-def _convert_date(col_name: str) -> pl.Expr:
+def _convert_date(expr: pl.Expr) -> pl.Expr:
     """
-    Converts the date to correct format.
+    Converts a date string expression to correct format.
 
     Three possibilities:
     - %B %-d, %Y.
     - %B %Y.
     - %Y.
-    We tell them apart by checking if a comma is present.
+    Rather than trying each format in turn,
+    the last two are filled out to the first one
+    (first day of the month, first month of the year),
+    so every value only has to be parsed once.
     """
     return (
-        pl
-        # first format
-        .when(pl.col(col_name).str.contains(",", literal=True))
-        .then(pl.col(col_name).str.strptime(pl.Date, "%B %-d, %Y", strict=False))
-        # second format
-        .when(pl.col(col_name).str.contains(" ", literal=True))
-        .then(pl.col(col_name).str.strptime(pl.Date, "%B %Y", strict=False))
+        expr
         # third format
-        .otherwise(pl.col(col_name).str.strptime(pl.Date, "%Y", strict=False))
+        .str.replace(r"^(\d{4})$", "January 1, $1")
+        # second format
+        .str.replace(r"^([A-Za-z]+) (\d{4})$", "$1 1, $2")
+        # first format
+        .str.strptime(pl.Date, "%B %-d, %Y", strict=False)
     )
 
 
-def _parse_current_shows(
-    c: NavigableString,
-    nhd: NickelodeanHeaderDepth,
-) -> pl.DataFrame:
+@functools.lru_cache(maxsize=8)
+def _col_index(cols: tuple[str, ...]) -> dict[str, int]:
     """
-    Parses table that is under H2: "Current Shows".
+    Position of each column in a table, by its name in `__col_map`.
 
-    Can use `c.text` to split by "\n" to get what we want.
-    Then each "row" has 6 elements.
-    But also first 2 elements are blank, so want to drop those.
-    Then, also not considering notes.
+    Only a few different sets of column names show up across all tables,
+    so each one is only mapped once.
+    Returned dict is shared between calls, so don't modify it.
     """
-    # determining number of columns in table
-    rows: list[str] = [r.strip() for r in str(c.text).split("\n\n")[1:] if r != ""]
-    cols: list[str] = rows.pop(0).split("\n")
-    # doing fix for notes, sometimes was separated by "\n\n"
-    if "Notes" in rows[0]:
-        cols.append("Notes")
-        rows.pop(0)
-
-    # making schema
-    table_schema: dict[str, pl.DataType] = {__col_map[col]: pl.Utf8 for col in cols}
-
-    table_vals: list[list[str]] = []
-    for row in rows:
-        row_vals: list[str] = row.split("\n")
-        # sometimes does not have notes when it should be here
-        if len(row_vals) != len(cols):
-            row_vals.append(None)
-        table_vals.append(row_vals)
-    # appending blank rows to fix incorrect schema inference
-    if len(cols) == 2:
-        table_vals.append([None, None])
-
-    # initial creation of df
-    table_df: pl.DataFrame = pl.DataFrame(
-        data=table_vals,
-        schema=table_schema,
-    )
-    # if we don't have NumberSeasons, add it
-    if "NumberSeasons" not in table_schema.keys():
-        table_df = table_df.with_columns(pl.lit(None, pl.Utf8).alias("NumberSeasons"))
-    # if we have notes, drop it
-    if "_notes" in table_schema.keys():
-        table_df = table_df.drop("_notes")
-
-    # cleanup and adding header columns
-    table_df = (
-        table_df
-        # filter out potential extra row
-        .filter(pl.col("Title").is_not_null())
-        .with_columns(
-            # removing notes from Title
-            _remove_notes("Title").name.keep(),
-            # converting PremiereDate
-            _convert_date("PremiereDate").name.keep(),
-            # converting number of seasons
-            pl.col("NumberSeasons").cast(pl.UInt16, strict=False).name.keep(),
-            # blank finale date
-            pl.lit(None, pl.Date).alias("FinaleDate"),
-            # headers 2, 3, 4, 5
-            pl.lit(nhd.h2, pl.Utf8).alias("H2"),
-            pl.lit(nhd.h3, pl.Utf8).alias("H3"),
-            pl.lit(nhd.h4, pl.Utf8).alias("H4"),
-            pl.lit(nhd.h5, pl.Utf8).alias("H5"),
+    return {__col_map[col]: i for i, col in enumerate(cols)}
+
+
+def _select_values(
+    cols: list[str],
+    table_vals: list[list[str | None]],
+) -> dict[str, list[str | None]]:
+    """
+    Pulls out the values of each column in `__raw_cols`.
+
+    Any column the table does not have is filled with null,
+    and notes are dropped.
+    """
+    col_index: dict[str, int] = _col_index(cols=tuple(cols))
+    return {
+        col: (
+            [row_vals[col_index[col]] for row_vals in table_vals]
+            if col in col_index
+            else [None] * len(table_vals)
         )
-        # adding sub index
-        .with_row_index(name="SubIndex")
-        .select(
-            "H2",
-            "H3",
-            "H4",
-            "H5",
-            "SubIndex",
-            "Title",
-            "PremiereDate",
-            "FinaleDate",
-            "NumberSeasons",
+        for col in __raw_cols
+    }
+
+
+def _split_tables(cs: list[Tag]) -> list[list[list[str]]]:
+    """
+    Splits the text of each table into the values of each of its rows.
+
+    Can use `c.text` to split by "\n\n" to get the rows,
+    and then split each row by "\n" to get its values.
+    The text of all tables is split at once in a single Polars column,
+    rather than looping over every row in Python.
+    """
+    return (
+        pl.Series([c.text for c in cs], dtype=pl.Utf8)
+        # splitting into rows, first one is blank
+        .str.split("\n\n")
+        .list.slice(1)
+        .list.eval(
+            pl.element()
+            .filter(pl.element() != "")
+            .str.strip_chars()
+            # splitting each row into its values
+            .str.split("\n")
         )
+        .to_list()
     )
-    return table_df
 
 
-def _is_date(v: str) -> bool:
+def _parse_current_shows(c: Tag) -> dict[str, list[str | None]]:
     """
-    Checks if it is a date.
+    Parses table that is under H2: "Current Shows".
+
+    Goes through each row of the table and each cell in that row,
+    where the first row has the column names.
+    Rows that are missing cells at the end (usually notes) are filled with null.
+    The notes column is dropped later, in `_select_values`.
     """
-    # getting rid of potential note and shorts
-    # v = v.split("[")[0]
-    v = v.split("[")[0].split(")")[-1]
-    # if it is year, count it
-    if len(v) == 4 and v[0] in ["1", "2"]:
-        return True
-    # comma check
-    if "," in v:
-        split_by_comma: list[str] = v.split(",")
-        # must be split into two
-        if len(split_by_comma) != 2:
-            return False
-        # last must have length of 4 + 1 for whitespace
-        if len(split_by_comma[1]) != 5:
-            return False
-        split_by_space: list[str] = split_by_comma[0].split(" ")
-        # day must have either 1 or 2 length (digits)
-        if len(split_by_space[1]) not in [1, 2]:
-            return False
-    else:
-        # %B %Y
-        split_by_space: list[str] = v.split(" ")
-        if len(split_by_space) != 2:
-            return False
-        # second must be year
-        if len(split_by_space[1]) == 4 and split_by_space[1][0] in ["1", "2"]:
-            return True
-        else:
-            return False
-    return True
+    trs: list[Tag] = c.find_all("tr")
+    cols: list[str] = [
+        cell.get_text().strip() for cell in trs[0].find_all(["th", "td"])
+    ]
+
+    table_vals: list[list[str | None]] = []
+    # binding once, rather than looking up the method for every row
+    append_row = table_vals.append
+    for tr in trs[1:]:
+        cells: list[Tag] = tr.find_all(["th", "td"])
+        append_row(
+            [
+                cells[i].get_text().strip() if i < len(cells) else None
+                for i in range(len(cols))
+            ]
+        )
+    return _select_values(cols=cols, table_vals=table_vals)
+
+
+# %B %-d, %Y or %B %Y or %Y, once notes and shorts are removed
+__date_pattern: str = r"^(?:[A-Z][a-z]+ (?:\d{1,2}, )?)?[12]\d{3}$"
 
 
-def _count_n_dates(row_vals: list[str]) -> int:
+def _find_dates(rows_vals: list[list[str]]) -> list[list[bool]]:
     """
-    Counts the number of dates present in a given row.
+    Checks which values in each row are dates.
 
-    Criteria for counting as a date:
-    - Contains a comma.
-    - First part has a
+    Rather than checking each value on its own,
+    all values are flattened into one column and matched against a regex,
+    after getting rid of any notes and shorts part.
+    Results are then split back up into rows.
     """
-    n_dates: int = 0
-    for v in row_vals:
-        if _is_date(v):
-            n_dates += 1
-    return n_dates
+    is_date: list[bool] = (
+        pl.DataFrame(
+            data={"Value": [v for row_vals in rows_vals for v in row_vals]},
+            schema={"Value": pl.Utf8},
+        )
+        .select(
+            _remove_notes(pl.col("Value"), remove_shorts=True).str.contains(
+                __date_pattern
+            )
+        )
+        .to_series()
+        .to_list()
+    )
+
+    rows_is_date: list[list[bool]] = []
+    append_row = rows_is_date.append
+    offset: int = 0
+    for row_vals in rows_vals:
+        append_row(is_date[offset : offset + len(row_vals)])
+        offset += len(row_vals)
+    return rows_is_date
 
 
 def _parse_former_shows(
-    c: NavigableString,
-    nhd: NickelodeanHeaderDepth,
-) -> pl.DataFrame:
+    cols: list[str],
+    rows_vals: list[list[str]],
+    rows_is_date: list[list[bool]],
+) -> dict[str, list[str | None]]:
     """
     Parsing former programming.
 
+    Takes the column names and the values of each row from `_split_tables`,
+    along with which of those values are dates from `_find_dates`.
+
     Here there is some annoying logic to deal with grouped dates.
     Some shows could have the same starting date,
     and so the date is combined into one value.
@@ -314,23 +331,17 @@ def _parse_former_shows(
     - Several shows have the same start and end date.
     - One show has different start and end dates (cancelled and re-aired).
     """
-    # determining number of columns in table
-    rows: list[str] = [r.strip() for r in str(c.text).split("\n\n")[1:] if r != ""]
-    cols: list[str] = rows.pop(0).split("\n")
-
-    # making schema
-    table_schema: dict[str, pl.DataType] = {__col_map[col]: pl.Utf8 for col in cols}
-
-    table_vals: list[list[str]] = []
+    table_vals: list[list[str | None]] = []
     prev_premiere_date: str = ""
     repeat_title_stack: list[str] = []
     repeat_date_stack: list[list[str]] = []
     are_combining_dates: bool = False
+    # binding once, rather than looking up the method for every row
+    append_row = table_vals.append
 
-    for row in rows:
-        row_vals: list[str] = row.split("\n")
+    for row_vals, row_is_date in zip(rows_vals, rows_is_date):
         # sometimes the premiere date is missing, so we have to add it
-        n_dates: int = _count_n_dates(row_vals=row_vals)
+        n_dates: int = sum(row_is_date)
         # has 2: normal
         if n_dates == 2:
             prev_premiere_date = row_vals[1]
@@ -343,7 +354,7 @@ def _parse_former_shows(
             are_combining_dates = True
             continue
         # if first entry is a date, push to stack
-        if _is_date(row_vals[0]):
+        if row_is_date[0]:
             repeat_date_stack.append(row_vals)
             continue
         # combining titles and dates that were grouped together
@@ -351,7 +362,7 @@ def _parse_former_shows(
             are_combining_dates = False
             while True:
                 # appending title and date
-                table_vals.append(
+                append_row(
                     [
                         repeat_title_stack[0],  # title
                         repeat_date_stack[0][0],  # first date
@@ -369,109 +380,184 @@ def _parse_former_shows(
         # sometimes does not have notes when it should be here
         if len(row_vals) != len(cols):
             row_vals.append(None)
-        table_vals.append(row_vals)
-    # appending blank rows to fix incorrect schema inference
-    if len(cols) == 2:
-        table_vals.append([None, None])
-
-    # initial creation of df
-    table_df: pl.DataFrame = pl.DataFrame(
-        data=table_vals,
-        schema=table_schema,
+        append_row(row_vals)
+    return _select_values(cols=cols, table_vals=table_vals)
+
+
+def parse_tables(
+    tables: list[tuple[tuple[str | None, str | None, str | None, str | None], Tag]],
+) -> pl.LazyFrame:
+    """
+    Parses all tables into one LazyFrame of raw string values.
+
+    Each table comes with its H2, H3, H4, H5 header values.
+    Former programming tables are all split up first,
+    so that their dates can be found with a single call to `_find_dates`.
+    Cleaning up the values is left to `clean_tables`,
+    which collects this together with the cleanup in a single query.
+
+    The headers are only recorded once per table, along with its number of rows,
+    and are then repeated out to every row at the end in Polars.
+    """
+    former_vals: list[list[list[str]]] = _split_tables(
+        cs=[c for headers, c in tables if headers[0] == "Former programming"]
+    )
+    former_is_date: list[list[bool]] = _find_dates(
+        rows_vals=[row_vals for rows_vals in former_vals for row_vals in rows_vals[1:]]
     )
 
-    # cleanup and adding header columns
-    table_df = (
-        table_df
-        # filter out potential extra row
-        .filter(pl.col("Title").is_not_null())
-        # removing any notes
-        .with_columns(
-            _remove_notes("Title").name.keep(),
-            _remove_notes("PremiereDate", remove_shorts=True).name.keep(),
-            _remove_notes("FinaleDate", remove_shorts=True).name.keep(),
-        )
-        # second round of adjustments
-        .with_columns(
-            # converting PremiereDate and FinaleDate
-            _convert_date("PremiereDate").name.keep(),
-            _convert_date("FinaleDate").name.keep(),
-            # blank NumberSeasons
-            pl.lit(None, pl.UInt16).alias("NumberSeasons"),
-            # headers 2, 3, 4, 5
-            pl.lit(nhd.h2, pl.Utf8).alias("H2"),
-            pl.lit(nhd.h3, pl.Utf8).alias("H3"),
-            pl.lit(nhd.h4, pl.Utf8).alias("H4"),
-            pl.lit(nhd.h5, pl.Utf8).alias("H5"),
-        )
-        # adding sub index
-        .with_row_index(name="SubIndex")
+    # headers and number of rows of each table
+    headers_schema: dict[str, pl.DataType] = {
+        "H2": pl.Utf8,
+        "H3": pl.Utf8,
+        "H4": pl.Utf8,
+        "H5": pl.Utf8,
+        "NRows": pl.UInt32,
+    }
+    headers_vals: dict[str, list[str | int | None]] = {
+        col: [] for col in headers_schema
+    }
+    # values of each column for all tables, built up table by table
+    raw_schema: dict[str, pl.DataType] = {
+        "Title": pl.Utf8,
+        "PremiereDate": pl.Utf8,
+        "FinaleDate": pl.Utf8,
+        "NumberSeasons": pl.Utf8,
+    }
+    raw_vals: dict[str, list[str | None]] = {col: [] for col in raw_schema}
+    former_index: int = 0
+    former_offset: int = 0
+    for headers, c in tables:
+        table_cols: dict[str, list[str | None]]
+        if headers[0] == "Current programming":
+            table_cols = _parse_current_shows(c=c)
+        elif headers[0] == "Former programming":
+            rows_vals: list[list[str]] = former_vals[former_index]
+            table_cols = _parse_former_shows(
+                cols=rows_vals[0],
+                rows_vals=rows_vals[1:],
+                rows_is_date=former_is_date[
+                    former_offset : former_offset + len(rows_vals) - 1
+                ],
+            )
+            former_index += 1
+            former_offset += len(rows_vals) - 1
+        else:
+            raise ValueError("Trying to parse an irrelevant H2 category.")
+
+        headers_vals["H2"].append(headers[0])
+        headers_vals["H3"].append(headers[1])
+        headers_vals["H4"].append(headers[2])
+        headers_vals["H5"].append(headers[3])
+        headers_vals["NRows"].append(len(table_cols["Title"]))
+        for col, vals in table_cols.items():
+            raw_vals[col].extend(vals)
+
+    # repeating headers for every row of their table, with index within the table
+    headers_df: pl.LazyFrame = (
+        pl.LazyFrame(data=headers_vals, schema=headers_schema)
+        .filter(pl.col("NRows") > 0)
         .select(
-            "H2",
-            "H3",
-            "H4",
-            "H5",
-            "SubIndex",
-            "Title",
-            "PremiereDate",
-            "FinaleDate",
-            "NumberSeasons",
+            pl.exclude("NRows").repeat_by(pl.col("NRows")),
+            pl.int_ranges(pl.col("NRows"), dtype=pl.UInt32).alias("SubIndex"),
         )
+        .explode(pl.all())
+    )
+    return pl.concat(
+        [headers_df, pl.LazyFrame(data=raw_vals, schema=raw_schema)],
+        how="horizontal",
     )
-    return table_df
 
 
-def parse_table(
-    c: NavigableString,
-    nhd: NickelodeanHeaderDepth,
-) -> pl.DataFrame:
+# same for every table, so only build these once
+__cleanup_exprs: list[pl.Expr] = [
+    # removing notes from Title
+    _remove_notes(pl.col("Title")).name.keep(),
+    # removing notes and converting PremiereDate and FinaleDate
+    _convert_date(_remove_notes(pl.col("PremiereDate"), remove_shorts=True)).alias(
+        "PremiereDate"
+    ),
+    _convert_date(_remove_notes(pl.col("FinaleDate"), remove_shorts=True)).alias(
+        "FinaleDate"
+    ),
+    # converting number of seasons
+    pl.col("NumberSeasons").cast(pl.UInt16, strict=False).name.keep(),
+]
+
+
+def clean_tables(table_df: pl.LazyFrame) -> pl.DataFrame:
     """
-    Parses table.
+    Cleans up the raw values from `parse_tables`.
 
     Final Schema is:
     - H2: pl.Utf8
     - H3: pl.Utf8
     - H4: pl.Utf8
     - H5: pl.Utf8
+    - SubIndex: pl.UInt32
     - Title: pl.Utf8
     - PremiereDate: pl.Date
-    - EndDate: pl.Date
-    - NumberSeasons: pl.Uint16
+    - FinaleDate: pl.Date
+    - NumberSeasons: pl.UInt16
     """
-    if nhd.h2 == "Current programming":
-        return _parse_current_shows(c=c, nhd=nhd)
-    elif nhd.h2 == "Former programming":
-        return _parse_former_shows(c=c, nhd=nhd)
-    else:
-        raise ValueError("Trying to parse an irrelevant H2 category.")
-
-
-# TODO: find proper way to get "meta"
-# main_body = wiki_soup.find(name="meta")
-main_body = wiki_soup.find(name="div", class_="mw-content-ltr mw-parser-output")
-c: NavigableString
-nhd: NickelodeanHeaderDepth = NickelodeanHeaderDepth()
-table_list: list[pl.DataFrame] = []
-for c in main_body.contents[7].children:
-    # skip blank
-    if c.name is None:
-        continue
-
-    # updating depth level between 2 and 5
-    if c.name in ["h2", "h3", "h4", "h5"]:
-        nhd.update_depth(ns=c)
-    # reading in table
-    elif c.name == "table":
-        if nhd.h2 not in ["Current programming", "Former programming"]:
-            continue
-        print(f"Current Level: {nhd.depth}, {nhd}")
-        df: pl.DataFrame = parse_table(c=c, nhd=nhd)
-        table_list.append(df)
+    return table_df.with_columns(__cleanup_exprs).collect()
+
+
+@functools.lru_cache
+def fetch_soup(url: str, cache: str) -> BeautifulSoup:
+    """
+    Gets the parsed page at `url`.
+
+    The raw page is saved to `cache`,
+    and we only hit Wikipedia again if that copy is more than a day old.
+    A failed request raises instead of being cached,
+    and the page is written to a temporary file first,
+    so `cache` is never left with an error page or half a page.
+    Only the main content div is parsed, see `nick_strainer`.
+    """
+    if not os.path.exists(cache) or time.time() - os.path.getmtime(cache) > 86_400:
+        wiki_page: rq.Response = nick_session.get(url)
+        wiki_page.raise_for_status()
+        os.makedirs(os.path.dirname(cache) or ".", exist_ok=True)
+        tmp_cache: str = f"{cache}.tmp"
+        with open(tmp_cache, "wb") as f:
+            f.write(wiki_page.content)
+        os.replace(tmp_cache, cache)
+    with open(cache, "rb") as f:
+        return BeautifulSoup(f.read(), "lxml", parse_only=nick_strainer)
+
+
+def main() -> None:
+    wiki_soup: BeautifulSoup = fetch_soup(url=nick_url, cache=nick_cache)
+    # TODO: find proper way to get "meta"
+    # main_body = wiki_soup.find(name="meta")
+    main_body = wiki_soup.find(name="div", class_="mw-content-ltr mw-parser-output")
+    c: Tag
+    nhd: NickelodeanHeaderDepth = NickelodeanHeaderDepth()
+    # tables along with their headers, all parsed together at the end
+    tables: list[tuple[tuple[str | None, str | None, str | None, str | None], Tag]] = []
+    # only headers and tables matter, so skip everything else up front
+    for c in main_body.find_all(["h2", "h3", "h4", "h5", "table"]):
+        # updating depth level between 2 and 5
+        if c.name != "table":
+            nhd.update_depth(ns=c)
+            if nhd.stop:
+                break
+        # reading in table
+        elif nhd.h2 in ["Current programming", "Former programming"]:
+            # only formatted when debug logging is turned on
+            logger.debug("Current Level: %d, %s", nhd.depth, nhd)
+            tables.append((nhd.as_tuple(), c))
+
+    nick_df: pl.DataFrame = clean_tables(parse_tables(tables=tables))
+    print(nick_df)
+    nick_df.write_parquet(
+        file="./data/nick.parquet",
+        compression="zstd",
+        compression_level=3,
+        statistics=True,
+    )
 
-    # don't want anything after this
-    if nhd.h3 == "Former aquired programming":
-        break
 
-nick_df: pl.DataFrame = pl.concat(table_list)
-print(nick_df)
-nick_df.write_parquet(file="./data/nick.parquet")
+if __name__ == "__main__":
+    main()